@@ -21,3 +21,15 @@ class VersionNotFound(PromptManagerError):
 
 class ImportErrorBadFormat(PromptManagerError):
     pass
+
+
+class ReadOnlyStorage(PromptManagerError):
+    pass
+
+
+class SnapshotBadFormat(PromptManagerError):
+    pass
+
+
+class SnapshotClosed(PromptManagerError):
+    pass
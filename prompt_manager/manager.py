@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import List
 from .storage.filesystem import FileSystemBackend
 from .storage.base import StorageBackend
+from .storage.snapshot import SnapshotBackend, build_snapshot
 from .project import Project, Prompt
 from .exceptions import ImportErrorBadFormat
 
@@ -14,18 +15,34 @@ class PromptManager:
     支持：
         - get_prompt("/proj/p1")   # 自动 strip '/'
         - import_prompt("xxx.json", "/newproj/foo")
+        - build_snapshot("prompts.snap") / from_snapshot("prompts.snap")
     """
 
     def __init__(self, root_path: str | Path, backend: StorageBackend | None = None):
         self.backend = backend or FileSystemBackend(root_path)
 
+    @classmethod
+    def from_snapshot(cls, path: str | Path) -> "PromptManager":
+        """以只读方式打开 build_snapshot 生成的快照文件"""
+        return cls(path, backend=SnapshotBackend(path))
+
+    def close(self) -> None:
+        """释放后端资源（如快照的 mmap）"""
+        self.backend.close()
+
+    def __enter__(self) -> "PromptManager":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
     # ---------- project ----------
     def list_projects(self) -> List[str]:
         return self.backend.list_projects()
 
     def get_project(self, name: str) -> Project:
         # 自动创建目录
-        self.backend._project_dir(name).mkdir(parents=True, exist_ok=True)
+        self.backend.mkdir_project(name)
         return Project(name=name, backend=self.backend)
 
     # ---------- prompt ----------
@@ -57,3 +74,17 @@ class PromptManager:
             return pr
         except ImportErrorBadFormat:
             raise
+
+    # ---------- snapshot ----------
+    def build_snapshot(
+        self,
+        path: str | Path,
+        projects: List[str] | None = None,
+        latest_only: bool = False,
+    ) -> Path:
+        """
+        把整个存储（或指定 projects）编译成单个只读快照文件，
+        供 from_snapshot 通过 mmap 快速加载。
+        latest_only: 每个 prompt 只保留 latest 版本
+        """
+        return build_snapshot(self.backend, path, projects, latest_only)
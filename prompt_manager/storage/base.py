@@ -14,11 +14,18 @@ class StorageBackend(ABC):
     def list_projects(self) -> List[str]:
         ...
 
+    def mkdir_project(self, project: str) -> None:
+        """确保项目存在；默认什么都不做"""
+
     # ---------- prompt ----------
     @abstractmethod
     def list_prompts(self, project: str) -> List[str]:
         ...
 
+    def walk_prompts(self, project: str) -> List[str]:
+        """递归列出项目下所有 prompt（名字可含 '/'）；默认同 list_prompts"""
+        return self.list_prompts(project)
+
     @abstractmethod
     def exists_prompt(self, project: str, prompt: str) -> bool:
         ...
@@ -41,3 +48,6 @@ class StorageBackend(ABC):
     @abstractmethod
     def mkdir_prompt(self, project: str, prompt: str) -> None:
         ...
+
+    def close(self) -> None:
+        """释放后端持有的资源；默认什么都不做"""
@@ -28,6 +28,9 @@ class FileSystemBackend(StorageBackend):
             return []
         return [p.name for p in self.root_path.iterdir() if p.is_dir()]
 
+    def mkdir_project(self, project: str) -> None:
+        self._project_dir(project).mkdir(parents=True, exist_ok=True)
+
     # ---------------- prompt -----------------
     def list_prompts(self, project: str) -> List[str]:
         proj = self._project_dir(project)
@@ -35,6 +38,18 @@ class FileSystemBackend(StorageBackend):
             raise ProjectNotFound(project)
         return [p.name for p in proj.iterdir() if p.is_dir()]
 
+    def walk_prompts(self, project: str) -> List[str]:
+        proj = self._project_dir(project)
+        if not proj.exists():
+            raise ProjectNotFound(project)
+        # 含有版本目录（prompt.txt + outputs.json）的目录即为 prompt
+        prompts = set()
+        for prompt_txt in proj.rglob("prompt.txt"):
+            vdir = prompt_txt.parent
+            if vdir != proj and vdir.parent != proj and (vdir / "outputs.json").exists():
+                prompts.add(vdir.parent.relative_to(proj).as_posix())
+        return sorted(prompts)
+
     def exists_prompt(self, project: str, prompt: str) -> bool:
         return self._prompt_dir(project, prompt).exists()
 
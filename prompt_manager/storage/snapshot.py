@@ -0,0 +1,316 @@
+# prompt_manager/storage/snapshot.py
+import json
+import mmap
+import os
+import struct
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from ..exceptions import (
+    ProjectNotFound,
+    PromptNotFound,
+    ReadOnlyStorage,
+    SnapshotBadFormat,
+    SnapshotClosed,
+)
+from ..types import PromptVersion, ModelOutput
+from .base import StorageBackend
+
+# 文件头：magic | 索引偏移 | 索引长度
+_MAGIC = b"PMSNAP01"
+_HEADER = struct.Struct("<8sQQ")
+
+Span = Tuple[int, int]                       # (offset, length)
+
+# PromptVersion 的 slot 描述符，SnapshotVersion 用它们存放解码后的值
+_content_slot = PromptVersion.content
+_outputs_slot = PromptVersion.model_outputs
+
+
+class SnapshotVersion(PromptVersion):
+    """
+    快照中的版本：content / model_outputs 只记录在 mmap 中的位置，
+    首次访问时才解码，之后缓存在原有的 slot 中。
+    copy / deepcopy / pickle 会先完整解码，得到普通的 PromptVersion；
+    dataclasses.replace 不支持，请先 copy.copy() 再修改。
+    """
+
+    __slots__ = ("_backend", "_content_span", "_outputs_span")
+
+    def __init__(
+        self,
+        backend: "SnapshotBackend",
+        version: str,
+        content_span: Span,
+        outputs_span: Span,
+        meta: Dict[str, Any],
+        created_at: datetime,
+    ):
+        self._backend = backend
+        self._content_span: Span | None = content_span
+        self._outputs_span: Span | None = outputs_span
+        self.version = version
+        self.meta = meta
+        self.created_at = created_at
+
+    @property
+    def content(self) -> str:
+        if self._content_span is not None:
+            _content_slot.__set__(self, self._backend._decode(self._content_span))
+            self._content_span = None
+        return _content_slot.__get__(self, PromptVersion)
+
+    @content.setter
+    def content(self, value: str) -> None:
+        _content_slot.__set__(self, value)
+        self._content_span = None
+
+    @property
+    def model_outputs(self) -> Dict[str, ModelOutput]:
+        if self._outputs_span is not None:
+            try:
+                raw_outputs = json.loads(self._backend._decode(self._outputs_span))
+                outputs = {
+                    k: ModelOutput(model_name=k, output=v["output"], meta=v.get("meta", {}))
+                    for k, v in raw_outputs.items()
+                }
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                raise self._backend._bad_format(f"bad outputs of {self.version}: {e}") from e
+            _outputs_slot.__set__(self, outputs)
+            self._outputs_span = None
+        return _outputs_slot.__get__(self, PromptVersion)
+
+    @model_outputs.setter
+    def model_outputs(self, value: Dict[str, ModelOutput]) -> None:
+        _outputs_slot.__set__(self, value)
+        self._outputs_span = None
+
+    def __eq__(self, other):
+        # 与字段相同的普通 PromptVersion 也视为相等
+        if not isinstance(other, PromptVersion):
+            return NotImplemented
+        return (
+            self.version,
+            self.content,
+            self.model_outputs,
+            self.meta,
+            self.created_at,
+        ) == (
+            other.version,
+            other.content,
+            other.model_outputs,
+            other.meta,
+            other.created_at,
+        )
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # 不携带 mmap：解码后以普通 PromptVersion 的形式复制 / 序列化
+        return (
+            PromptVersion,
+            (self.version, self.content, self.model_outputs, self.meta, self.created_at),
+        )
+
+
+# ----------------------------------------------------------------------
+# 构建快照
+# ----------------------------------------------------------------------
+def build_snapshot(
+    source: StorageBackend,
+    path: str | Path,
+    projects: List[str] | None = None,
+    latest_only: bool = False,
+) -> Path:
+    """
+    把 source 中的 prompt 编译成单个只读快照文件。
+    文件结构：
+        header | content / outputs / 版本索引 数据块 ... | 顶层索引(JSON)
+    projects:    只打包指定项目，默认全部
+    latest_only: 每个 prompt 只保留最后一个版本
+    """
+    path = Path(path).expanduser()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+
+    try:
+        _write_snapshot(source, tmp, projects, latest_only)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    os.replace(tmp, path)
+    return path
+
+
+def _write_snapshot(
+    source: StorageBackend,
+    tmp: Path,
+    projects: List[str] | None,
+    latest_only: bool,
+) -> None:
+    index: Dict[str, Dict[str, Span]] = {}
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, 0, 0))
+
+        def write_blob(data: bytes) -> Span:
+            offset = f.tell()
+            f.write(data)
+            return offset, len(data)
+
+        for project in sorted(projects if projects is not None else source.list_projects()):
+            index[project] = {}
+            for prompt in sorted(source.walk_prompts(project)):
+                versions = source.load_versions(project, prompt)
+                if latest_only:
+                    versions = versions[-1:]
+                if not versions:        # 空 prompt 不写入快照
+                    continue
+
+                entries = []
+                for v in versions:
+                    outputs_json = {
+                        k: {"output": mo.output, "meta": mo.meta}
+                        for k, mo in v.model_outputs.items()
+                    }
+                    entries.append(
+                        {
+                            "version": v.version,
+                            "content": write_blob(v.content.encode("utf-8")),
+                            "outputs": write_blob(
+                                json.dumps(outputs_json, ensure_ascii=False).encode("utf-8")
+                            ),
+                            "meta": v.meta,
+                            "created_at": v.created_at.isoformat(),
+                        }
+                    )
+                index[project][prompt] = write_blob(
+                    json.dumps(entries, ensure_ascii=False).encode("utf-8")
+                )
+
+        index_offset, index_size = write_blob(
+            json.dumps({"projects": index}, ensure_ascii=False).encode("utf-8")
+        )
+        f.seek(0)
+        f.write(_HEADER.pack(_MAGIC, index_offset, index_size))
+
+
+# ----------------------------------------------------------------------
+# 只读后端
+# ----------------------------------------------------------------------
+class SnapshotBackend(StorageBackend):
+    """
+    通过 mmap 打开 build_snapshot 生成的文件。
+    打开时只解析顶层索引；prompt 的版本索引在 load_versions 时解析，
+    content / outputs 在访问时才解码。
+    同一主机上的多个进程共享操作系统的 page cache。
+    """
+
+    def __init__(self, root_path: str | Path):
+        super().__init__(root_path)
+        with open(self.root_path, "rb") as f:
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:      # 空文件
+                raise SnapshotBadFormat(f"{self.root_path}: {e}") from e
+
+        if len(self._mm) < _HEADER.size:
+            self._mm.close()
+            raise SnapshotBadFormat(f"{self.root_path}: file too small")
+        magic, index_offset, index_size = _HEADER.unpack_from(self._mm, 0)
+        if (
+            magic != _MAGIC
+            or index_offset < _HEADER.size
+            or index_offset + index_size > len(self._mm)
+        ):
+            self._mm.close()
+            raise SnapshotBadFormat(f"{self.root_path}: not a prompt snapshot")
+
+        try:
+            index = json.loads(self._decode((index_offset, index_size)))
+            self._index: Dict[str, Dict[str, Span]] = index["projects"]
+        except (SnapshotBadFormat, ValueError, KeyError, TypeError) as e:
+            self._mm.close()
+            raise SnapshotBadFormat(f"{self.root_path}: bad index: {e}") from e
+
+    # ---------------- helpers ----------------
+    def _bad_format(self, what: str) -> SnapshotBadFormat:
+        return SnapshotBadFormat(f"{self.root_path}: {what}")
+
+    def _check_span(self, span: Span) -> Span:
+        offset, size = span
+        if (
+            not isinstance(offset, int)
+            or not isinstance(size, int)
+            or offset < _HEADER.size
+            or size < 0
+            or offset + size > len(self._mm)
+        ):
+            raise self._bad_format(f"span {span!r} out of bounds")
+        return offset, size
+
+    def _decode(self, span: Span) -> str:
+        if self._mm.closed:
+            raise SnapshotClosed(f"snapshot {self.root_path} is closed")
+        offset, size = self._check_span(span)
+        with memoryview(self._mm) as mv, mv[offset : offset + size] as chunk:
+            try:
+                return str(chunk, "utf-8")
+            except UnicodeDecodeError as e:
+                raise self._bad_format(f"bad utf-8 at {span!r}") from e
+
+    def _read_only(self, what: str) -> ReadOnlyStorage:
+        return ReadOnlyStorage(f"snapshot {self.root_path} is read-only: {what}")
+
+    def close(self) -> None:
+        self._mm.close()
+
+    # ---------------- project ----------------
+    def list_projects(self) -> List[str]:
+        return list(self._index)
+
+    def mkdir_project(self, project: str) -> None:
+        if project not in self._index:
+            raise ProjectNotFound(project)
+
+    # ---------------- prompt -----------------
+    def list_prompts(self, project: str) -> List[str]:
+        if project not in self._index:
+            raise ProjectNotFound(project)
+        return list(self._index[project])
+
+    def exists_prompt(self, project: str, prompt: str) -> bool:
+        return prompt in self._index.get(project, {})
+
+    def load_versions(self, project: str, prompt: str) -> List[PromptVersion]:
+        if not self.exists_prompt(project, prompt):
+            raise PromptNotFound(f"{project}/{prompt}")
+
+        try:
+            entries = json.loads(self._decode(self._index[project][prompt]))
+            return [
+                SnapshotVersion(
+                    backend=self,
+                    version=e["version"],
+                    content_span=self._check_span(tuple(e["content"])),
+                    outputs_span=self._check_span(tuple(e["outputs"])),
+                    meta=e.get("meta", {}),
+                    created_at=datetime.fromisoformat(e["created_at"]),
+                )
+                for e in entries
+            ]
+        except (ValueError, KeyError, TypeError) as e:
+            raise self._bad_format(f"bad entries of {project}/{prompt}: {e}") from e
+
+    def save_version(
+        self, project: str, prompt: str, version: PromptVersion, overwrite: bool = False
+    ) -> None:
+        raise self._read_only(f"cannot save {project}/{prompt}/{version.version}")
+
+    def delete_version(self, project: str, prompt: str, version_name: str) -> None:
+        raise self._read_only(f"cannot delete {project}/{prompt}/{version_name}")
+
+    # ---------------- misc -------------------
+    def mkdir_prompt(self, project: str, prompt: str) -> None:
+        # 只有 exists_prompt 为 False 时才会被调用，视为查找失败
+        raise PromptNotFound(f"{project}/{prompt}")
@@ -0,0 +1,217 @@
+import copy
+import dataclasses
+import json
+import pickle
+import struct
+import tempfile
+from pathlib import Path
+
+from prompt_manager import PromptManager
+from prompt_manager.exceptions import (
+    ProjectNotFound,
+    PromptNotFound,
+    ReadOnlyStorage,
+    SnapshotBadFormat,
+    SnapshotClosed,
+)
+from prompt_manager.types import PromptVersion
+
+
+def _make_store(root: Path) -> PromptManager:
+    pm = PromptManager(root / "save")
+
+    p = pm.get_prompt("/demo/hello/j2")            # 名字含 '/'
+    p.add_version(
+        content="Hello {name}!",
+        model_outputs={
+            "gpt-4o": "Hi Alice 👋",
+            "llama3": {"output": "Hello, Alice.", "meta": {"temp": 0.3}},
+        },
+        meta={"lang": "en"},
+    )
+    p.add_version(content="你好 {name}！", model_outputs={"gpt-4o": "你好"}, meta={"lang": "zh"})
+    p.save()
+
+    q = pm.get_prompt("/other/greet")
+    q.add_version(content="Hey", model_outputs={}, meta={})
+    q.save()
+
+    pm.get_prompt("/demo/empty")                    # 无版本，不应写入快照
+    return pm
+
+
+def _expect(exc, fn, *args, **kwargs):
+    try:
+        fn(*args, **kwargs)
+    except exc:
+        return
+    raise AssertionError(f"{exc.__name__} not raised")
+
+
+def test_round_trip():
+    with tempfile.TemporaryDirectory() as d:
+        root = Path(d)
+        pm = _make_store(root)
+        snap = pm.build_snapshot(root / "all.snap")
+        assert not (root / "all.snap.tmp").exists()
+
+        s = PromptManager.from_snapshot(snap)
+        assert s.list_projects() == ["demo", "other"]
+        assert s.get_project("demo").list_prompts() == ["hello/j2"]
+
+        src = pm.get_prompt("/demo/hello/j2").versions
+        got = s.get_prompt("/demo/hello/j2").versions
+        assert [v.version for v in got] == ["v0001", "v0002"]
+        for a, b in zip(src, got):
+            # 文件系统后端不保存 created_at，以快照中的时间为准
+            assert dataclasses.replace(a, created_at=b.created_at) == b
+            assert b == dataclasses.replace(a, created_at=b.created_at)
+
+        # copy / pickle 得到普通 PromptVersion
+        v = s.get_prompt("/demo/hello/j2").latest
+        for c in (copy.copy(v), copy.deepcopy(v), pickle.loads(pickle.dumps(v))):
+            assert type(c) is PromptVersion
+            assert c.content == "你好 {name}！"
+
+        lazy = s.get_prompt("/other/greet").latest
+        s.close()
+        _expect(SnapshotClosed, lambda: lazy.content)
+
+        with PromptManager.from_snapshot(snap) as s:
+            read = s.get_prompt("/other/greet").latest
+            assert read.content == "Hey"
+        assert read.content == "Hey"                  # 已解码的字段在 close 后仍可用
+
+
+def test_latest_only_and_projects_filter():
+    with tempfile.TemporaryDirectory() as d:
+        root = Path(d)
+        pm = _make_store(root)
+        with PromptManager.from_snapshot(
+            pm.build_snapshot(root / "l.snap", projects=["demo"], latest_only=True)
+        ) as s:
+            assert s.list_projects() == ["demo"]
+            assert [v.version for v in s.get_prompt("/demo/hello/j2").versions] == ["v0002"]
+            _expect(ProjectNotFound, s.get_project, "other")
+
+        _expect(ProjectNotFound, pm.build_snapshot, root / "m.snap", projects=["missing"])
+        assert not (root / "m.snap.tmp").exists()
+        assert not (root / "m.snap").exists()
+
+
+def test_read_only():
+    with tempfile.TemporaryDirectory() as d:
+        root = Path(d)
+        pm = _make_store(root)
+        with PromptManager.from_snapshot(pm.build_snapshot(root / "all.snap")) as s:
+            p = s.get_prompt("/demo/hello/j2")
+            p.modify_version("v0001", content="changed")
+            _expect(ReadOnlyStorage, p.save, overwrite_existing=True)
+            _expect(ReadOnlyStorage, p.delete_version, "v0001")
+            _expect(PromptNotFound, s.get_prompt, "/demo/new")
+
+
+def test_stray_version_files_at_project_root():
+    with tempfile.TemporaryDirectory() as d:
+        root = Path(d)
+        pm = _make_store(root)
+        (root / "save" / "other" / "prompt.txt").write_text("x", encoding="utf-8")
+        (root / "save" / "other" / "outputs.json").write_text("{}", encoding="utf-8")
+        with PromptManager.from_snapshot(pm.build_snapshot(root / "all.snap")) as s:
+            assert s.get_project("other").list_prompts() == ["greet"]
+
+
+def test_bad_format():
+    with tempfile.TemporaryDirectory() as d:
+        root = Path(d)
+        header = struct.Struct("<8sQQ")
+        cases = {
+            "empty": b"",
+            "small": b"PMSNAP01",
+            "magic": header.pack(b"XXXXXXXX", header.size, 0),
+            "inside_header": header.pack(b"PMSNAP01", 0, 5),
+            "json": header.pack(b"PMSNAP01", header.size, 5) + b"xxxxx",
+            "utf8": header.pack(b"PMSNAP01", header.size, 2) + b"\xff\xfe",
+            "no_projects": header.pack(b"PMSNAP01", header.size, 2) + b"{}",
+        }
+        for name, data in cases.items():
+            f = root / name
+            f.write_bytes(data)
+            _expect(SnapshotBadFormat, PromptManager.from_snapshot, f)
+
+
+def _corrupt_snapshot(root: Path, entries_blob: bytes) -> Path:
+    """手工拼一个快照：单个 prompt p/x，其版本索引为 entries_blob"""
+    header = struct.Struct("<8sQQ")
+    body = b"AAAA" + b"\xff\xfe" + b'{"m": {"output": "x", "meta": {}}}' + b'["bad"]'
+    entries_offset = header.size + len(body)
+    index = json.dumps({"projects": {"p": {"x": [entries_offset, len(entries_blob)]}}})
+    index_offset = entries_offset + len(entries_blob)
+    f = root / "corrupt.snap"
+    f.write_bytes(
+        header.pack(b"PMSNAP01", index_offset, len(index))
+        + body
+        + entries_blob
+        + index.encode("utf-8")
+    )
+    return f
+
+
+def _entry(content, outputs) -> bytes:
+    return json.dumps(
+        [
+            {
+                "version": "v0001",
+                "content": content,
+                "outputs": outputs,
+                "meta": {},
+                "created_at": "2024-01-01T00:00:00",
+            }
+        ]
+    ).encode("utf-8")
+
+
+def test_bad_entries():
+    h = struct.calcsize("<8sQQ")
+    good_content, bad_utf8 = [h, 4], [h + 4, 2]
+    good_outputs, bad_outputs = [h + 6, 34], [h + 40, 7]
+    with tempfile.TemporaryDirectory() as d:
+        root = Path(d)
+
+        # 正常构造的数据能读出
+        with PromptManager.from_snapshot(
+            _corrupt_snapshot(root, _entry(good_content, good_outputs))
+        ) as s:
+            v = s.get_prompt("/p/x").latest
+            assert v.content == "AAAA"
+            assert v.model_outputs["m"].output == "x"
+
+        # 版本索引损坏 / span 越界 -> load_versions 报错
+        for blob in (
+            b"xxxxx",
+            b"\xff\xfe",
+            b'{"a": 1}',
+            _entry([h, 1 << 20], good_outputs),
+            _entry([0, 4], good_outputs),
+            _entry("oops", good_outputs),
+        ):
+            with PromptManager.from_snapshot(_corrupt_snapshot(root, blob)) as s:
+                _expect(SnapshotBadFormat, lambda: s.get_prompt("/p/x").versions)
+
+        # 内容 / 输出损坏 -> 访问字段时报错
+        with PromptManager.from_snapshot(
+            _corrupt_snapshot(root, _entry(bad_utf8, bad_outputs))
+        ) as s:
+            v = s.get_prompt("/p/x").latest
+            _expect(SnapshotBadFormat, lambda: v.content)
+            _expect(SnapshotBadFormat, lambda: v.model_outputs)
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_latest_only_and_projects_filter()
+    test_read_only()
+    test_stray_version_files_at_project_root()
+    test_bad_format()
+    test_bad_entries()
+    print("snapshot checks passed")